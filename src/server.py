@@ -52,12 +52,17 @@ Example:
 from __future__ import annotations
 
 import os
+import sys
+import time
+from collections.abc import Callable
 from datetime import datetime
-from typing import Optional, Literal
+from functools import cache, lru_cache
+from typing import Any, Optional, Literal, get_args
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
 
-import pytz
 from pydantic import Field, BaseModel
 from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool as MCPTool
 
 """
 1. Environment Configuration
@@ -91,6 +96,9 @@ TIMEZONE = os.environ.get("TIMEZONE", "UTC")
 
 Create MCP server instance with metadata
 
+The tool list is static once the module is imported, so list_tools builds the
+Tool descriptors on the first request and returns the same list afterwards
+
 Examples:
   Server name: "uvx-datetime-mcp-server"
   Version: "0.1.0"
@@ -100,68 +108,105 @@ Examples:
 
 メタデータを持つMCPサーバーインスタンスを作成
 
+ツール一覧はモジュールのインポート後は変わらないため、list_toolsは最初のリクエストで
+Tool記述子を構築し、以降は同じリストを返します
+
 例:
   サーバー名: "uvx-datetime-mcp-server"
   バージョン: "0.1.0"
   プロトコル: Model Context Protocol (MCP)
 """
-mcp = FastMCP("uvx-datetime-mcp-server")
+
+
+class CachedToolsFastMCP(FastMCP):
+    """FastMCP server that builds the tool list once and reuses it until a tool is added or removed."""
+
+    _tool_list: list[MCPTool] | None = None
+
+    async def list_tools(self) -> list[MCPTool]:
+        if self._tool_list is None:
+            self._tool_list = await super().list_tools()
+        return self._tool_list
+
+    def add_tool(self, *args: Any, **kwargs: Any) -> None:
+        super().add_tool(*args, **kwargs)
+        self._tool_list = None
+
+    def remove_tool(self, *args: Any, **kwargs: Any) -> None:
+        super().remove_tool(*args, **kwargs)
+        self._tool_list = None
+
+
+mcp = CachedToolsFastMCP("uvx-datetime-mcp-server")
 
 
 """
-3. Date Formatting Function
+3. Date Formatters
 
-Helper function to format date based on format type
+Table of formatter functions keyed by format type.
+unix and unix_ms are timezone-independent and read from the clock instead (see _CLOCK_VALUES)
 
 Examples:
-  format_datetime(now, "iso", "UTC") → "2024-01-15T10:30:00.000000+00:00"
-  format_datetime(now, "unix", "UTC") → "1705318200"
-  format_datetime(now, "human", "America/New_York") → "Mon, Jan 15, 2024 05:30:00 AM EST"
-  format_datetime(now, "date", "Asia/Tokyo") → "2024-01-15"
-  format_datetime(now, "time", "Europe/London") → "10:30:00"
-  format_datetime(now, "custom", "UTC") → Uses DATE_FORMAT_STRING environment variable
+  _FORMATTERS["iso"](now) → "2024-01-15T10:30:00.000000+00:00"
+  _FORMATTERS["human"](now) → "Mon, Jan 15, 2024 05:30:00 AM EST" (America/New_York)
+  _FORMATTERS["date"](now) → "2024-01-15"
+  _FORMATTERS["time"](now) → "10:30:00"
+  _FORMATTERS["custom"](now) → Uses DATE_FORMAT_STRING environment variable
 
-3. 日付フォーマット関数
+3. 日付フォーマッター
 
-形式タイプに基づいて日付をフォーマットするヘルパー関数
+形式タイプをキーとするフォーマッター関数のテーブル。
+unixとunix_msはタイムゾーンに依存しないため、代わりに時計から直接取得します(_CLOCK_VALUES参照)
 
 例:
-  format_datetime(now, "iso", "UTC") → "2024-01-15T10:30:00.000000+00:00"
-  format_datetime(now, "unix", "UTC") → "1705318200"
-  format_datetime(now, "human", "America/New_York") → "Mon, Jan 15, 2024 05:30:00 AM EST"
-  format_datetime(now, "date", "Asia/Tokyo") → "2024-01-15"
-  format_datetime(now, "time", "Europe/London") → "10:30:00"
-  format_datetime(now, "custom", "UTC") → DATE_FORMAT_STRING環境変数を使用
+  _FORMATTERS["iso"](now) → "2024-01-15T10:30:00.000000+00:00"
+  _FORMATTERS["human"](now) → "Mon, Jan 15, 2024 05:30:00 AM EST" (America/New_York)
+  _FORMATTERS["date"](now) → "2024-01-15"
+  _FORMATTERS["time"](now) → "10:30:00"
+  _FORMATTERS["custom"](now) → DATE_FORMAT_STRING環境変数を使用
 """
 
 
-def format_datetime(now: datetime, format_type: str) -> str:
-    """
-    Format datetime based on requested format type.
+_WDAY = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MON = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_WDAY_LONG = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MON_LONG = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
 
-    Args:
-        now: datetime object to format
-        format_type: Output format type
 
-    Returns:
-        Formatted datetime string
+def _format_human(now: datetime) -> str:
     """
-    if format_type == "iso":
-        return now.isoformat()
-    elif format_type == "unix":
-        return str(int(now.timestamp()))
-    elif format_type == "unix_ms":
-        return str(int(now.timestamp() * 1000))
-    elif format_type == "human":
-        return now.strftime("%a, %b %d, %Y %I:%M:%S %p %Z")
-    elif format_type == "date":
-        return now.strftime("%Y-%m-%d")
-    elif format_type == "time":
-        return now.strftime("%H:%M:%S")
-    elif format_type == "custom":
-        return format_custom_date(now, DATE_FORMAT_STRING)
-    else:
-        return now.isoformat()
+    Format now as "Mon, Jan 15, 2024 10:30:00 AM UTC".
+
+    Equivalent to now.strftime("%a, %b %d, %Y %I:%M:%S %p %Z") in the C locale,
+    assembled directly from the datetime fields.
+    """
+    hour = now.hour
+    return (
+        f"{_WDAY[now.weekday()]}, {_MON[now.month - 1]} {now.day:02d}, {now.year} "
+        f"{(hour + 11) % 12 + 1:02d}:{now.minute:02d}:{now.second:02d} {'AM' if hour < 12 else 'PM'} "
+        f"{now.tzname() or ''}"
+    )
+
+
+_FORMATTERS: dict[str, Callable[[datetime], str]] = {
+    "iso": datetime.isoformat,
+    "human": _format_human,
+    "date": lambda d: d.strftime("%Y-%m-%d"),
+    "time": lambda d: d.strftime("%H:%M:%S"),
+}
 
 
 """
@@ -170,41 +215,117 @@ def format_datetime(now: datetime, format_type: str) -> str:
 Simple custom date formatter with token replacement for Python strftime codes
 
 Examples:
-  format_custom_date(now, "%Y-%m-%d", "UTC") → "2024-01-15"
-  format_custom_date(now, "%d/%m/%Y %H:%M", "UTC") → "15/01/2024 10:30"
-  format_custom_date(now, "%y-%m-%d %H:%M:%S", "UTC") → "24-01-15 10:30:45"
+  DATE_FORMAT_STRING="%Y-%m-%d" → "2024-01-15"
+  DATE_FORMAT_STRING="%d/%m/%Y %H:%M" → "15/01/2024 10:30"
+  DATE_FORMAT_STRING="%y-%m-%d %H:%M:%S" → "24-01-15 10:30:45"
+  DATE_FORMAT_STRING="%A, %B %d" → "Monday, January 15"
   Supported tokens: %Y (4-digit year), %y (2-digit year), %m (month), %d (day)
                     %H (24-hour), %M (minutes), %S (seconds)
+                    %a / %A (weekday name), %b / %B (month name)
 
 4. カスタム日付フォーマッター
 
 Python strftimeコードによるトークン置換を使用したシンプルなカスタム日付フォーマッター
 
 例:
-  format_custom_date(now, "%Y-%m-%d", "UTC") → "2024-01-15"
-  format_custom_date(now, "%d/%m/%Y %H:%M", "UTC") → "15/01/2024 10:30"
-  format_custom_date(now, "%y-%m-%d %H:%M:%S", "UTC") → "24-01-15 10:30:45"
+  DATE_FORMAT_STRING="%Y-%m-%d" → "2024-01-15"
+  DATE_FORMAT_STRING="%d/%m/%Y %H:%M" → "15/01/2024 10:30"
+  DATE_FORMAT_STRING="%y-%m-%d %H:%M:%S" → "24-01-15 10:30:45"
+  DATE_FORMAT_STRING="%A, %B %d" → "Monday, January 15"
   サポートされるトークン: %Y (4桁の年), %y (2桁の年), %m (月), %d (日)
                         %H (24時間), %M (分), %S (秒)
-"""
+                        %a / %A (曜日名), %b / %B (月名)
+
+DATE_FORMAT_STRING is compiled once at import: if it only uses the supported
+tokens it is turned into a str.format template, otherwise it falls back to strftime.
 
+DATE_FORMAT_STRINGはインポート時に一度だけコンパイルされます: サポートされるトークンのみを
+使用している場合はstr.formatテンプレートに変換され、それ以外はstrftimeにフォールバックします。
+"""
 
-def format_custom_date(now: datetime, format_string: str) -> str:
+# strftime directive → str.format field over
+# (year, year % 100, month, day, hour, minute, second, weekday, weekday long, month name, month name long)
+_CUSTOM_DIRECTIVES = {
+    "Y": "{0}",
+    "y": "{1:02d}",
+    "m": "{2:02d}",
+    "d": "{3:02d}",
+    "H": "{4:02d}",
+    "M": "{5:02d}",
+    "S": "{6:02d}",
+    "a": "{7}",
+    "A": "{8}",
+    "b": "{9}",
+    "B": "{10}",
+    "%": "%",
+}
+_CUSTOM_NAME_DIRECTIVES = frozenset("aAbB")
+
+
+def _compile_custom_format(format_string: str) -> Callable[[datetime], str] | None:
     """
-    Simple custom date formatter using Python strftime.
+    Compile a strftime format string into a reusable formatter.
 
     Args:
-        now: datetime object to format
         format_string: Python strftime format string
 
     Returns:
-        Formatted datetime string using the custom format
+        Formatter producing the same output as now.strftime(format_string),
+        or None if the format uses a directive other than the supported tokens
 
     Examples:
-        format_custom_date(now, "%Y-%m-%d") → "2024-01-15"
-        format_custom_date(now, "%d/%m/%Y %H:%M") → "15/01/2024 10:30"
+        _compile_custom_format("%Y-%m-%d")(now) → "2024-01-15"
+        _compile_custom_format("%A, %B %d")(now) → "Monday, January 15"
+        _compile_custom_format("%j") → None
     """
-    return now.strftime(format_string)
+    parts = []
+    uses_names = False
+    i = 0
+    while i < len(format_string):
+        char = format_string[i]
+        if char != "%":
+            parts.append(char.replace("{", "{{").replace("}", "}}"))
+            i += 1
+            continue
+        directive = format_string[i + 1 : i + 2]
+        field = _CUSTOM_DIRECTIVES.get(directive)
+        if field is None:
+            return None
+        uses_names = uses_names or directive in _CUSTOM_NAME_DIRECTIVES
+        parts.append(field)
+        i += 2
+
+    template = "".join(parts)
+
+    if not uses_names:
+
+        def _format(d: datetime) -> str:
+            return template.format(d.year, d.year % 100, d.month, d.day, d.hour, d.minute, d.second)
+
+        return _format
+
+    def _format_with_names(d: datetime) -> str:
+        weekday = d.weekday()
+        month = d.month
+        return template.format(
+            d.year,
+            d.year % 100,
+            month,
+            d.day,
+            d.hour,
+            d.minute,
+            d.second,
+            _WDAY[weekday],
+            _WDAY_LONG[weekday],
+            _MON[month - 1],
+            _MON_LONG[month - 1],
+        )
+
+    return _format_with_names
+
+
+_COMPILED_CUSTOM_FORMATTER = _compile_custom_format(DATE_FORMAT_STRING)
+_FORMATTERS["custom"] = _COMPILED_CUSTOM_FORMATTER or (lambda d: d.strftime(DATE_FORMAT_STRING))
 
 
 """
@@ -257,15 +378,92 @@ class TimeResult(BaseModel):
 6. MCP Tool
 
 Expose the tool that returns a structured result.
+The tool is a plain function since it never awaits; FastMCP calls sync tools
+inline, so no coroutine is created per request.
 
 Examples: { "format": "iso" } / { "format": "unix", "timezone": "UTC" } / {}
 
 6. MCPツール
 
 ベースのツールを公開します。構造化された結果を返します。
+ツールは await を行わないため通常の関数として定義します。FastMCPは同期ツールを
+直接呼び出すため、リクエストごとにコルーチンは生成されません。
 """
 
 
+@cache
+def _timezone_names_by_lower() -> dict[str, str]:
+    """Map lowercased IANA timezone names to their canonical spelling, built on first use."""
+    return {name.lower(): name for name in available_timezones()}
+
+
+@lru_cache(maxsize=256)
+def _resolve_timezone(name: str) -> ZoneInfo:
+    """
+    Resolve a timezone name as given by the client, memoizing the result.
+
+    Zone names were case-insensitive with pytz ("asia/tokyo", "utc"), so a name
+    ZoneInfo does not find is retried with its canonical spelling. Caching the
+    resolved ZoneInfo keeps that failed filesystem lookup off repeated requests.
+    Unknown names raise ValueError and are not cached.
+    """
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, OSError) as e:
+        # OSError covers tz database directories such as "America" (IsADirectoryError)
+        canonical = _timezone_names_by_lower().get(name.lower())
+        if canonical is None:
+            raise ValueError(f"Error: Unknown timezone '{name}'") from e
+        return ZoneInfo(canonical)
+
+
+# Unix timestamps do not depend on the timezone, so read them straight from the clock
+_CLOCK_VALUES: dict[str, Callable[[], int]] = {
+    "unix": lambda: time.time_ns() // 1_000_000_000,
+    "unix_ms": lambda: time.time_ns() // 1_000_000,
+}
+
+# Formatters whose output only changes once per second; their last result is reused within the same second
+_SECOND_RESOLUTION_FORMATTERS = {_FORMATTERS["human"], _FORMATTERS["date"], _FORMATTERS["time"]}
+if _COMPILED_CUSTOM_FORMATTER is not None:
+    _SECOND_RESOLUTION_FORMATTERS.add(_COMPILED_CUSTOM_FORMATTER)
+
+_last_formatted: tuple[tuple[Callable[[datetime], str], ZoneInfo, int], str] | None = None
+
+
+def _format_now_cached(
+    formatter: Callable[[datetime], str],
+    tz: ZoneInfo,
+    _time: Callable[[], float] = time.time,
+    _fromtimestamp: Callable[[float, ZoneInfo], datetime] = datetime.fromtimestamp,
+) -> str:
+    """
+    Format the current time with a second-resolution formatter, reusing the
+    previous result when the formatter, timezone and second are unchanged.
+
+    _time and _fromtimestamp are bound as defaults so they are read as locals.
+    """
+    global _last_formatted
+    now = _time()
+    key = (formatter, tz, int(now))
+    if _last_formatted is not None and _last_formatted[0] == key:
+        return _last_formatted[1]
+    value = formatter(_fromtimestamp(now, tz))
+    _last_formatted = (key, value)
+    return value
+
+
+# TimeResult is built without validation, so reject an unsupported DATETIME_FORMAT once at startup
+_VALID_FORMATS = get_args(TimeResult.model_fields["format"].annotation)
+if DATETIME_FORMAT not in _VALID_FORMATS:
+    raise ValueError(f"Error: Unknown DATETIME_FORMAT '{DATETIME_FORMAT}'. Valid: {', '.join(_VALID_FORMATS)}.")
+
+# DATETIME_FORMAT is fixed at startup, so resolve its clock/formatter once for requests without "format".
+# Exactly one of the two is set for every valid format.
+_DEFAULT_CLOCK = _CLOCK_VALUES.get(DATETIME_FORMAT)
+_DEFAULT_FORMATTER = _FORMATTERS.get(DATETIME_FORMAT)
+
+
 @mcp.tool(
     name="get_current_time",
     description="Get current date/time using Pydantic args and structured result",
@@ -277,30 +475,31 @@ def get_current_time(args: TimeArgs) -> TimeResult:
     - Unknown timezone → ValueError('Error: Unknown timezone "<tzname>"')
     - format="custom" uses DATE_FORMAT_STRING
     """
-    fmt = args.format or DATETIME_FORMAT
+    if args.format is None:
+        fmt, clock, formatter = DATETIME_FORMAT, _DEFAULT_CLOCK, _DEFAULT_FORMATTER
+    else:
+        fmt = args.format
+        clock, formatter = _CLOCK_VALUES.get(fmt), _FORMATTERS.get(fmt)
     tzname = args.timezone or TIMEZONE
 
-    try:
-        tz = pytz.timezone(tzname)
-    except pytz.exceptions.UnknownTimeZoneError as e:
-        raise ValueError(f"Error: Unknown timezone '{tzname}'") from e
-
-    now = datetime.now(tz)
+    tz = _resolve_timezone(tzname)
 
-    if fmt == "unix":
-        value: int | str = int(now.timestamp())
-    elif fmt == "unix_ms":
-        value = int(now.timestamp() * 1000)
+    if clock is not None:
+        value: int | str = clock()
+    elif formatter in _SECOND_RESOLUTION_FORMATTERS:
+        value = _format_now_cached(formatter, tz)
     else:
-        value = format_datetime(now, fmt)
+        value = formatter(datetime.now(tz))
 
-    return TimeResult(format=fmt, timezone=tzname, value=value)
+    # Every field is already validated (args by Pydantic, value by its formatter), so skip re-validation
+    return TimeResult.model_construct(format=fmt, timezone=tzname, value=value)
 
 
 """
 7. Server Startup Function
 
-Initialize and run the MCP server with stdio transport
+Initialize and run the MCP server with stdio transport.
+Startup messages go to stderr in a single write, since stdout carries the MCP protocol
 
 Examples:
   Normal startup → "DateTime MCP Server running on stdio"
@@ -312,7 +511,8 @@ Examples:
 
 7. サーバー起動関数
 
-stdioトランスポートでMCPサーバーを初期化して実行
+stdioトランスポートでMCPサーバーを初期化して実行。
+stdoutはMCPプロトコルで使用されるため、起動メッセージは一度の書き込みでstderrに出力
 
 例:
   通常の起動 → "DateTime MCP Server running on stdio"
@@ -325,9 +525,8 @@ stdioトランスポートでMCPサーバーを初期化して実行
 
 
 def main() -> None:
-    print("DateTime MCP Server running on stdio")
-    print(f"Default format: {DATETIME_FORMAT}")
-    print(f"Default timezone: {TIMEZONE}")
+    message = f"DateTime MCP Server running on stdio\nDefault format: {DATETIME_FORMAT}\nDefault timezone: {TIMEZONE}\n"
     if DATETIME_FORMAT == "custom":
-        print(f"Custom format string: {DATE_FORMAT_STRING}")
+        message += f"Custom format string: {DATE_FORMAT_STRING}\n"
+    sys.stderr.write(message)
     mcp.run(transport="stdio")